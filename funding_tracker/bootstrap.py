@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
@@ -12,7 +11,7 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.date import DateTrigger
 
 from funding_tracker.db import UOWFactoryType, create_uow_factory
-from funding_tracker.exchanges import EXCHANGES
+from funding_tracker.exchanges import EXCHANGE_IDS, EXCHANGES
 from funding_tracker.materialized_view_refresher import MaterializedViewRefresher
 from funding_tracker.orchestration import ExchangeOrchestrator
 
@@ -47,7 +46,6 @@ async def bootstrap(
         mv_refresher=mv_refresher,
         concurrency_limit=concurrency_limit,
     )
-    _register_service_jobs(scheduler=scheduler, mv_refresher=mv_refresher)
 
     logger.info(
         "Bootstrap complete: %s exchange(s), %s job(s)",
@@ -67,16 +65,15 @@ def _resolve_exchanges(exchanges: list[str] | None) -> list[str]:
         logger.info("No exchanges assigned to this instance")
         return []
 
-    available = set(EXCHANGES.keys())
-    unknown = [exchange for exchange in exchanges if exchange not in available]
+    unknown = [exchange for exchange in exchanges if exchange not in EXCHANGE_IDS]
     if unknown:
         logger.warning(
             "Unknown exchange IDs will be skipped: %s. Available: %s",
             sorted(set(unknown)),
-            sorted(available),
+            sorted(EXCHANGE_IDS),
         )
 
-    valid = [exchange for exchange in exchanges if exchange in available]
+    valid = [exchange for exchange in exchanges if exchange in EXCHANGE_IDS]
     if not valid:
         raise KeyError(f"No valid exchanges left after filtering: {sorted(set(unknown))}")
 
@@ -127,7 +124,7 @@ def _register_exchange_jobs(
             exchange_adapter=EXCHANGES[exchange_name],
             section_name=exchange_name,
             uow_factory=uow_factory,
-            semaphore=asyncio.Semaphore(concurrency_limit),
+            concurrency_limit=concurrency_limit,
             mv_refresher=mv_refresher,
         )
         _register_update_job(scheduler, exchange_name, orchestrator)
@@ -170,15 +167,3 @@ def _register_live_job(
         exchange_name,
         second,
     )
-
-
-def _register_service_jobs(
-    scheduler: AsyncIOScheduler, mv_refresher: MaterializedViewRefresher
-) -> None:
-    """Register process-wide background jobs."""
-    scheduler.add_job(
-        mv_refresher.check_and_refresh_if_needed,
-        trigger=CronTrigger(second="*"),
-        name="materialized_views_refresher",
-    )
-    logger.info("Registered materialized view refresher (every second)")
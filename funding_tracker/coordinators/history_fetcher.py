@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from quantshark_shared.models.contract import Contract
 from quantshark_shared.models.historical_funding_point import HistoricalFundingPoint
 
-from funding_tracker.db import UOWFactoryType
+from funding_tracker.db import UnitOfWork
 
 if TYPE_CHECKING:
     from funding_tracker.exchanges.base import BaseExchange
@@ -18,12 +18,12 @@ PROGRESS_LOG_BATCH_INTERVAL = 10
 async def sync_contract(
     exchange_adapter: "BaseExchange",
     contract: Contract,
-    uow_factory: UOWFactoryType,
+    uow: UnitOfWork,
 ) -> int:
     """Fetch backwards until no more data; marks contract as synced.
 
-    Opens/closes session for each DB operation to avoid holding sessions open
-    during long API calls.
+    Commits after each DB operation so the session's connection goes back to the pool
+    during long API calls; the session itself is reused across batches.
     """
     if contract.synced:
         exchange_adapter.logger.debug(
@@ -42,10 +42,10 @@ async def sync_contract(
     while True:
         batch_count += 1
 
-        async with uow_factory() as uow:
-            oldest = await uow.historical_funding_records.get_oldest_for_contract(contract.id)
-            # minus 1 second to avoid refetching the oldest point
-            before_timestamp = oldest.timestamp - timedelta(seconds=1) if oldest else None
+        oldest = await uow.historical_funding_records.get_oldest_for_contract(contract.id)
+        await uow.commit()
+        # minus 1 second to avoid refetching the oldest point
+        before_timestamp = oldest.timestamp - timedelta(seconds=1) if oldest else None
 
         exchange_adapter.logger.debug(
             f"Sync batch #{batch_count}: {contract.asset.name}/{contract.quote_name} - "
@@ -55,10 +55,9 @@ async def sync_contract(
         points = await exchange_adapter.fetch_history_before(contract, before_timestamp)
 
         if not points:
-            async with uow_factory() as uow:
-                merged_contract = await uow.merge(contract)
-                merged_contract.synced = True
-                await uow.commit()
+            merged_contract = await uow.merge(contract)
+            merged_contract.synced = True
+            await uow.commit()
             exchange_adapter.logger.info(
                 f"No more history for {contract.asset.name}/{contract.quote_name}, "
                 f"marking as synced (total batches: {batch_count}, total points: {total_points})"
@@ -74,9 +73,8 @@ async def sync_contract(
             for point in points
         ]
 
-        async with uow_factory() as uow:
-            await uow.historical_funding_records.bulk_insert_ignore(funding_records)
-            await uow.commit()
+        await uow.historical_funding_records.bulk_insert_ignore(funding_records)
+        await uow.commit()
 
         batch_points = len(points)
         total_points += batch_points
@@ -102,7 +100,7 @@ async def sync_contract(
 async def update_contract(
     exchange_adapter: "BaseExchange",
     contract: Contract,
-    uow_factory: UOWFactoryType,
+    uow: UnitOfWork,
 ) -> int:
     """Fetch new data after latest point; skips if interval not elapsed."""
     exchange_adapter.logger.debug(
@@ -110,43 +108,45 @@ async def update_contract(
         f"on {contract.section_name}"
     )
 
-    async with uow_factory() as uow:
-        newest = await uow.historical_funding_records.get_newest_for_contract(contract.id)
-        # add 1 second to avoid refetching already existing point
-        after_timestamp = newest.timestamp + timedelta(seconds=1) if newest else None
+    newest = await uow.historical_funding_records.get_newest_for_contract(contract.id)
+    # End the read transaction so no connection is held during the API call
+    await uow.commit()
+    # add 1 second to avoid refetching already existing point
+    after_timestamp = newest.timestamp + timedelta(seconds=1) if newest else None
 
-        if after_timestamp is None:
-            exchange_adapter.logger.warning(
-                f"No historical data found for {contract.asset.name}/{contract.quote_name}, "
-                f"run sync first"
-            )
-            return 0
+    if after_timestamp is None:
+        exchange_adapter.logger.warning(
+            f"No historical data found for {contract.asset.name}/{contract.quote_name}, "
+            f"run sync first"
+        )
+        return 0
 
-        now = datetime.now()
-        time_since_last = now - after_timestamp
-        required_interval = timedelta(hours=contract.funding_interval)
+    now = datetime.now()
+    time_since_last = now - after_timestamp
+    required_interval = timedelta(hours=contract.funding_interval)
 
-        if time_since_last < required_interval:
-            exchange_adapter.logger.debug(
-                f"Skipping update for {contract.asset.name}/{contract.quote_name}, "
-                f"only {time_since_last} passed (need {required_interval})"
-            )
-            return 0
+    if time_since_last < required_interval:
+        exchange_adapter.logger.debug(
+            f"Skipping update for {contract.asset.name}/{contract.quote_name}, "
+            f"only {time_since_last} passed (need {required_interval})"
+        )
+        return 0
 
-        points = await exchange_adapter.fetch_history_after(contract, after_timestamp)
+    points = await exchange_adapter.fetch_history_after(contract, after_timestamp)
 
-        if not points:
-            return 0
+    if not points:
+        return 0
 
-        funding_records = [
-            HistoricalFundingPoint(
-                contract_id=contract.id,
-                timestamp=point.timestamp,
-                funding_rate=point.rate,
-            )
-            for point in points
-        ]
+    funding_records = [
+        HistoricalFundingPoint(
+            contract_id=contract.id,
+            timestamp=point.timestamp,
+            funding_rate=point.rate,
+        )
+        for point in points
+    ]
 
-        await uow.historical_funding_records.bulk_insert_ignore(funding_records)
+    await uow.historical_funding_records.bulk_insert_ignore(funding_records)
+    await uow.commit()
 
-        return len(points)
+    return len(points)
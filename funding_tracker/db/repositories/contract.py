@@ -1,7 +1,10 @@
 from collections.abc import Iterable, Sequence
+from datetime import datetime
+from uuid import UUID
 
 from quantshark_shared.models.contract import Contract
-from sqlalchemy.sql.expression import select
+from quantshark_shared.models.historical_funding_point import HistoricalFundingPoint
+from sqlalchemy.sql.expression import desc, select
 
 from funding_tracker.db.repositories.base import Repository
 from funding_tracker.db.repositories.utils import bulk_insert
@@ -12,17 +15,38 @@ class ContractRepository(Repository[Contract]):
 
     async def get_by_section(self, section_name: str) -> Sequence[Contract]:
         stmt = select(Contract).where(Contract.section_name == section_name)  # type: ignore[arg-type]
-        result = await self._session.execute(stmt)
-        return result.scalars().all()
+        return (await self._session.scalars(stmt)).all()
 
     async def get_active_by_section(self, section_name: str) -> Sequence[Contract]:
         """Returns non-deprecated contracts only."""
         stmt = select(Contract).where(  # type: ignore[arg-type]
             Contract.section_name == section_name,  # type: ignore[arg-type]
-            Contract.deprecated == False,  # type: ignore[arg-type]  # noqa: E712
+            Contract.deprecated.is_(False),  # type: ignore[attr-defined]
+        )
+        return (await self._session.scalars(stmt)).all()
+
+    async def get_newest_history_timestamps(self, section_name: str) -> dict[UUID, datetime]:
+        """Newest historical point per synced active contract, in one round trip.
+
+        Contracts without any history are omitted.
+        """
+        newest = (
+            select(HistoricalFundingPoint.timestamp)
+            .where(HistoricalFundingPoint.contract_id == Contract.id)  # type: ignore[arg-type]
+            .order_by(desc(HistoricalFundingPoint.timestamp))  # type: ignore[arg-type]
+            .limit(1)
+            .correlate(Contract)  # type: ignore[arg-type]
+            .scalar_subquery()
+        )
+        stmt = select(Contract.id, newest).where(  # type: ignore[call-overload]
+            Contract.section_name == section_name,  # type: ignore[arg-type]
+            Contract.deprecated.is_(False),  # type: ignore[attr-defined]
+            Contract.synced.is_(True),  # type: ignore[attr-defined]
         )
         result = await self._session.execute(stmt)
-        return result.scalars().all()
+        return {
+            contract_id: timestamp for contract_id, timestamp in result if timestamp is not None
+        }
 
     async def upsert_many(self, contracts: Iterable[Contract]) -> None:
         """Updates funding_interval and deprecated on conflict."""
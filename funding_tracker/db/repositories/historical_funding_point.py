@@ -16,8 +16,7 @@ class HistoricalFundingPointRepository(Repository[HistoricalFundingPoint]):
             .order_by(asc(HistoricalFundingPoint.timestamp))  # type: ignore[arg-type]
             .limit(1)
         )
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._session.scalar(stmt)
 
     async def get_newest_for_contract(self, contract_id: UUID) -> HistoricalFundingPoint | None:
         stmt = (
@@ -26,5 +25,4 @@ class HistoricalFundingPointRepository(Repository[HistoricalFundingPoint]):
             .order_by(desc(HistoricalFundingPoint.timestamp))  # type: ignore[arg-type]
             .limit(1)
         )
-        result = await self._session.execute(stmt)
-        return result.scalar_one_or_none()
+        return await self._session.scalar(stmt)
@@ -1,10 +1,15 @@
 """Utility functions for repository operations."""
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Sequence
+from itertools import islice
+from operator import attrgetter
 from typing import Any, Literal, TypeVar, cast
 from uuid import UUID
 
 from quantshark_shared.models.base import NameModel, UUIDModel
+from sqlalchemy import Text, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import asc, desc, select
@@ -19,6 +24,53 @@ class SQLModelWithTable(SQLModel):
     __table__: Any
 
 
+_table_infos: dict[type[SQLModelWithTable], tuple[Any, tuple[str, ...]]] = {}
+_conflict_updates: dict[
+    tuple[type[SQLModelWithTable], tuple[str, ...], tuple[str, ...]], dict[str, Any]
+] = {}
+
+
+def _table_info(model: type[SQLModelWithTable]) -> tuple[Any, tuple[str, ...]]:
+    """Table and column keys of a model, resolved once per model class."""
+    info = _table_infos.get(model)
+    if info is None:
+        table = model.__table__
+        info = _table_infos[model] = (table, tuple(column.key for column in table.columns))
+    return info
+
+
+def _row_values_getter(keys: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """attrgetter over keys that always returns a tuple, also for a single key."""
+    getter = attrgetter(*keys)
+    if len(keys) == 1:
+        return lambda record: (getter(record),)
+    return getter
+
+
+def _conflict_update(
+    model: type[SQLModelWithTable],
+    conflict_target: tuple[str, ...] | None,
+    update_fields: tuple[str, ...] | None,
+) -> dict[str, Any]:
+    """ON CONFLICT DO UPDATE arguments, built once per (model, conflict handling) combination.
+
+    The excluded column references do not depend on the inserted rows, so every chunk and
+    call reuses the same SET mapping instead of rebuilding it.
+    """
+    if not conflict_target or not update_fields:
+        raise ValueError("conflict_target and update_fields are required for on_conflict='update'")
+
+    key = (model, conflict_target, update_fields)
+    conflict_update = _conflict_updates.get(key)
+    if conflict_update is None:
+        excluded = pg_insert(_table_info(model)[0]).excluded
+        conflict_update = _conflict_updates[key] = {
+            "index_elements": list(conflict_target),
+            "set_": {field: getattr(excluded, field) for field in update_fields},
+        }
+    return conflict_update
+
+
 async def bulk_insert(
     session: AsyncSession,
     model: type[M],
@@ -33,50 +85,50 @@ async def bulk_insert(
     Args:
         session: Database session
         model: SQLModel class
-        records: Iterable of model instances to insert
+        records: Iterable of model instances to insert, consumed one chunk at a time
         conflict_target: Columns for conflict detection (required for on_conflict='update')
         on_conflict: Conflict resolution strategy ('ignore' or 'update')
         update_fields: Fields to update on conflict (required for on_conflict='update')
-        chunk_size: Number of records to insert per query
+        chunk_size: Number of records held in memory and inserted per query
 
     Raises:
         ValueError: If on_conflict='update' but conflict_target or update_fields not provided
     """
-    records_list = list(records)
-    if not records_list:
-        return
-
     model_cls_with_table = cast(type[SQLModelWithTable], model)
-    table_columns = model_cls_with_table.__table__.columns
+    # Validates the conflict arguments before any record is read
+    conflict_update = (
+        _conflict_update(
+            model_cls_with_table,
+            tuple(conflict_target) if conflict_target else None,
+            tuple(update_fields) if update_fields else None,
+        )
+        if on_conflict == "update"
+        else None
+    )
+
+    records_iter = iter(records)
+    chunk = list(islice(records_iter, chunk_size))
+    if not chunk:
+        return
 
-    values = [
-        {
-            column.key: getattr(record, column.key)
-            for column in table_columns
-            if hasattr(record, column.key)
-        }
-        for record in records_list
-    ]
+    table, column_keys = _table_info(model_cls_with_table)
 
-    for i in range(0, len(values), chunk_size):
-        chunk = values[i : i + chunk_size]
-        stmt = pg_insert(model_cls_with_table.__table__).values(chunk)
+    # Records of one model share their attributes: resolve the column set once
+    sample = chunk[0]
+    keys = tuple(key for key in column_keys if hasattr(sample, key))
+    getter = _row_values_getter(keys)
 
+    while chunk:
+        values = [dict(zip(keys, getter(record), strict=True)) for record in chunk]
+        # One multi-row INSERT per chunk; psycopg's executemany would send a row at a time
+        stmt = pg_insert(table).values(values)
         if on_conflict == "ignore":
             stmt = stmt.on_conflict_do_nothing()
-        elif on_conflict == "update":
-            if not conflict_target or not update_fields:
-                raise ValueError(
-                    "conflict_target and update_fields are required for on_conflict='update'"
-                )
-            stmt = stmt.on_conflict_do_update(
-                index_elements=conflict_target,
-                set_={field: getattr(stmt.excluded, field) for field in update_fields},
-            )
+        elif conflict_update is not None:
+            stmt = stmt.on_conflict_do_update(**conflict_update)
 
         await session.execute(stmt)
-
-    await session.flush()
+        chunk = list(islice(records_iter, chunk_size))
 
 
 async def get_by_uuid(
@@ -95,8 +147,7 @@ async def get_by_uuid(
         Model instance or None if not found
     """
     stmt = select(model).where(model.id == id)  # type: ignore[arg-type]
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+    return await session.scalar(stmt)
 
 
 async def get_by_uuids(
@@ -114,9 +165,10 @@ async def get_by_uuids(
     Returns:
         Sequence of model instances
     """
-    stmt = select(model).where(model.id.in_(ids))  # type: ignore[arg-type]
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    # One array parameter instead of a placeholder per id: no bind-parameter limit
+    ids_param = bindparam("ids", ids, type_=ARRAY(PG_UUID(as_uuid=True)))
+    stmt = select(model).where(model.id == any_(ids_param))  # type: ignore[arg-type]
+    return (await session.scalars(stmt)).all()
 
 
 async def get_by_name(
@@ -135,8 +187,7 @@ async def get_by_name(
         Model instance or None if not found
     """
     stmt = select(model).where(model.name == name)  # type: ignore[arg-type]
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+    return await session.scalar(stmt)
 
 
 async def get_by_names(
@@ -154,9 +205,9 @@ async def get_by_names(
     Returns:
         Sequence of model instances
     """
-    stmt = select(model).where(model.name.in_(names))  # type: ignore[arg-type]
-    result = await session.execute(stmt)
-    return result.scalars().all()
+    names_param = bindparam("names", names, type_=ARRAY(Text))
+    stmt = select(model).where(model.name == any_(names_param))  # type: ignore[arg-type]
+    return (await session.scalars(stmt)).all()
 
 
 async def get_last_record[T: SQLModel](
@@ -175,8 +226,7 @@ async def get_last_record[T: SQLModel](
         Most recent model instance or None if no records
     """
     stmt = select(model).order_by(desc(getattr(model, timestamp_column))).limit(1)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+    return await session.scalar(stmt)
 
 
 async def get_first_record[T: SQLModel](
@@ -195,5 +245,4 @@ async def get_first_record[T: SQLModel](
         Oldest model instance or None if no records
     """
     stmt = select(model).order_by(asc(getattr(model, timestamp_column))).limit(1)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+    return await session.scalar(stmt)
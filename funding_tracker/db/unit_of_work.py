@@ -150,6 +150,10 @@ class UnitOfWork:
         """Roll back the current transaction."""
         await self._session.rollback()
 
+    def expunge_all(self) -> None:
+        """Detach all instances from the session, emptying its identity map."""
+        self._session.expunge_all()
+
     async def _close(self) -> None:
         """Close the session with cancellation protection.
 
@@ -75,4 +75,10 @@ def _build_registry() -> dict[str, BaseExchange]:
 
 EXCHANGES: dict[str, BaseExchange] = _build_registry()
 
-__all__ = ["EXCHANGES", "BaseExchange"]
+# Registered exchange IDs, for membership checks without rebuilding a set
+EXCHANGE_IDS: frozenset[str] = frozenset(EXCHANGES)
+
+# Registered exchange IDs in sorted order, for listing and instance sharding
+EXCHANGES_SORTED: tuple[str, ...] = tuple(sorted(EXCHANGES))
+
+__all__ = ["EXCHANGES", "EXCHANGES_SORTED", "EXCHANGE_IDS", "BaseExchange"]
@@ -29,6 +29,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -235,11 +236,5 @@ class AsterExchange(BaseExchange):
 
         All markets fetched in one request via premiumIndex, then mapped to contracts.
         """
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
@@ -39,7 +39,7 @@ class BackpackExchange(BaseExchange):
             if market["marketType"] == "PERP":
                 symbol = market["symbol"]
                 asset_name, quote_name, _ = symbol.split("_")
-                funding_interval = market["fundingInterval"] / (1000 * 60 * 60)
+                funding_interval = market["fundingInterval"] // 3_600_000
 
                 contracts.append(
                     ContractInfo(
@@ -58,9 +58,9 @@ class BackpackExchange(BaseExchange):
         # Remove interval suffix for API (accepts both formats)
         api_symbol = self._format_symbol(contract).rsplit("_", 1)[0]
         funding_interval = contract.funding_interval
-        end_time = before_timestamp or datetime.now()
-
         now = datetime.now()
+        end_time = before_timestamp or now
+
         # offset=1 skips future record, starts from most recent calculated
         offset_end = 1 + int((now - end_time).total_seconds() / (funding_interval * 3600))
         offset_start = offset_end + (self._FETCH_STEP // funding_interval)
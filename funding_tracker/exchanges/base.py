@@ -1,8 +1,10 @@
 """Base exchange adapter using ABC."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
+from uuid import UUID
 
 from quantshark_shared.models.contract import Contract
 
@@ -18,6 +20,7 @@ class BaseExchange(ABC):
 
     EXCHANGE_ID: str
     _FETCH_STEP: int
+    _symbol_cache: dict[UUID, str]
 
     """Fetch step size in hours (or records if exchange limits by records, not time).
 
@@ -25,6 +28,11 @@ class BaseExchange(ABC):
     Document per-exchange reasoning in class docstring.
     """
 
+    LIVE_CONCURRENCY: int = 10
+    """Max in-flight requests across fetch_live_parallel() calls (individual-API adapters)."""
+
+    _live_semaphore: asyncio.Semaphore | None = None
+
     @property
     def logger(self) -> logging.Logger:
         """Exchange logger for use in coordinators.
@@ -42,6 +50,16 @@ class BaseExchange(ABC):
         """
         return logging.getLogger(f"funding_tracker.exchanges.{self.EXCHANGE_ID}.live")
 
+    @property
+    def live_semaphore(self) -> asyncio.Semaphore:
+        """Semaphore shared by every fetch_live_parallel() call of this adapter.
+
+        Created lazily on first use so it is bound to the running event loop.
+        """
+        if self._live_semaphore is None:
+            self._live_semaphore = asyncio.Semaphore(self.LIVE_CONCURRENCY)
+        return self._live_semaphore
+
     def __init_subclass__(cls) -> None:
         """Validate subclass implements required methods."""
         super().__init_subclass__()
@@ -49,6 +67,21 @@ class BaseExchange(ABC):
         if not hasattr(cls, "EXCHANGE_ID"):
             raise NotImplementedError(f"{cls.__name__}: missing EXCHANGE_ID class attribute")
 
+        # Per-adapter memo for _cached_symbol()
+        cls._symbol_cache = {}
+
+    def _cached_symbol(self, contract: Contract) -> str:
+        """_format_symbol() memoized by contract id.
+
+        Contracts are reloaded from the database on every poll, so the cache is keyed by
+        id rather than object identity. Only use when the symbol is derived from immutable
+        contract fields (asset, quote).
+        """
+        symbol = self._symbol_cache.get(contract.id)
+        if symbol is None:
+            symbol = self._symbol_cache[contract.id] = self._format_symbol(contract)
+        return symbol
+
     @abstractmethod
     def _format_symbol(self, contract: Contract) -> str:
         """Format exchange-specific symbol from Contract."""
@@ -15,6 +15,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -29,18 +30,20 @@ class BybitExchange(BaseExchange):
     # 200 records max, 1-hour min interval -> 198 hours (200 - 2 safety buffer)
     _FETCH_STEP = 198
 
+    # Quote -> symbol suffix; quotes not listed here are used as-is
     _SUFFIXES = {"USDT": "USDT", "USDC": "PERP"}
 
     def _format_symbol(self, contract: Contract) -> str:
-        suffix = self._SUFFIXES.get(contract.quote_name, contract.quote_name)
-        return f"{contract.asset.name}{suffix}"
+        quote = contract.quote_name
+        return contract.asset.name + self._SUFFIXES.get(quote, quote)
 
     async def get_contracts(self) -> list[ContractInfo]:
         all_contracts = []
         cursor = None
 
         while True:
-            params = {"category": "linear"}
+            # Max page size: usually covers all linear instruments in one request
+            params = {"category": "linear", "limit": 1000}
             if cursor:
                 params["cursor"] = cursor
 
@@ -54,19 +57,17 @@ class BybitExchange(BaseExchange):
             if not cursor:
                 break
 
-        contracts = []
-        for contract in all_contracts:
-            if contract["contractType"] == "LinearPerpetual":
-                contracts.append(
-                    ContractInfo(
-                        asset_name=contract["baseCoin"],
-                        quote=contract["quoteCoin"],
-                        funding_interval=int(contract["fundingInterval"] / 60),
-                        section_name=self.EXCHANGE_ID,
-                    )
-                )
-
-        return contracts
+        # fundingInterval is in minutes
+        return [
+            ContractInfo(
+                asset_name=contract["baseCoin"],
+                quote=contract["quoteCoin"],
+                funding_interval=int(contract["fundingInterval"]) // 60,
+                section_name=self.EXCHANGE_ID,
+            )
+            for contract in all_contracts
+            if contract["contractType"] == "LinearPerpetual"
+        ]
 
     async def _fetch_history(
         self, contract: Contract, start_ms: int, end_ms: int
@@ -116,11 +117,5 @@ class BybitExchange(BaseExchange):
         return rates
 
     async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
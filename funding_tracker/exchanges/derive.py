@@ -12,6 +12,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -27,7 +28,7 @@ class DeriveExchange(BaseExchange):
     _FETCH_STEP = 720
 
     def _format_symbol(self, contract: Contract) -> str:
-        return f"{contract.asset.name}-PERP"
+        return contract.asset.name + "-PERP"
 
     async def get_contracts(self) -> list[ContractInfo]:
         all_instruments = []
@@ -135,11 +136,5 @@ class DeriveExchange(BaseExchange):
         return rates
 
     async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractInfo:
     asset_name: str
     quote: str
@@ -12,7 +12,7 @@ class ContractInfo:
     section_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FundingPoint:
     rate: float  # Decimal format: 0.0001 = 0.01%
     timestamp: datetime
@@ -11,6 +11,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -26,7 +27,7 @@ class DydxExchange(BaseExchange):
     _FETCH_STEP = 1000
 
     def _format_symbol(self, contract: Contract) -> str:
-        return f"{contract.asset.name}-USD"
+        return contract.asset.name + "-USD"
 
     async def get_contracts(self) -> list[ContractInfo]:
         response = await http_client.get(
@@ -71,16 +72,13 @@ class DydxExchange(BaseExchange):
 
         assert isinstance(response, dict)
 
-        points = []
-        raw_records = response.get("historicalFunding", [])
-
-        if raw_records:
-            for raw_record in raw_records:
-                rate = float(raw_record["rate"])
-                timestamp = datetime.fromisoformat(raw_record["effectiveAt"])
-                points.append(FundingPoint(rate=rate, timestamp=timestamp))
-
-        return points
+        return [
+            FundingPoint(
+                rate=float(raw_record["rate"]),
+                timestamp=datetime.fromisoformat(raw_record["effectiveAt"]),
+            )
+            for raw_record in response.get("historicalFunding") or []
+        ]
 
     async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
         response = await http_client.get(
@@ -104,11 +102,5 @@ class DydxExchange(BaseExchange):
         return rates
 
     async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
@@ -22,6 +22,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -37,7 +38,7 @@ class ExtendedExchange(BaseExchange):
     _FETCH_STEP = 2160
 
     def _format_symbol(self, contract: Contract) -> str:
-        return f"{contract.asset.name}-{contract.quote_name}"
+        return "-".join((contract.asset.name, contract.quote_name))
 
     async def get_contracts(self) -> list[ContractInfo]:
         response = await http_client.get(f"{self.API_ENDPOINT}/api/v1/info/markets")
@@ -85,15 +86,13 @@ class ExtendedExchange(BaseExchange):
         if response.get("status") != "OK":
             raise RuntimeError(f"Extended API error: {response}")
 
-        raw_records = response.get("data", [])
-
-        points = []
-        for record in raw_records:
-            rate = float(record["f"])
-            timestamp = datetime.fromtimestamp(record["T"] / 1000.0)
-            points.append(FundingPoint(rate=rate, timestamp=timestamp))
-
-        return points
+        return [
+            FundingPoint(
+                rate=float(record["f"]),
+                timestamp=datetime.fromtimestamp(record["T"] / 1000.0),
+            )
+            for record in response.get("data", [])
+        ]
 
     async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
         """Fetch all live rates in one batch request.
@@ -130,11 +129,5 @@ class ExtendedExchange(BaseExchange):
 
         All markets fetched in one request, then mapped to contracts.
         """
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
@@ -11,6 +11,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -39,7 +40,6 @@ class HyperliquidExchange(BaseExchange):
         response = await http_client.post(
             self.API_ENDPOINT,
             json=json_payload,
-            headers={"Content-Type": "application/json"},
         )
 
         assert isinstance(response, dict)
@@ -70,7 +70,6 @@ class HyperliquidExchange(BaseExchange):
                 "startTime": start_ms,
                 "endTime": end_ms,
             },
-            headers={"Content-Type": "application/json"},
         )
 
         points = []
@@ -91,39 +90,32 @@ class HyperliquidExchange(BaseExchange):
         response = await http_client.post(
             self.API_ENDPOINT,
             json=json_payload,
-            headers={"Content-Type": "application/json"},
         )
 
         assert isinstance(response, list)
         meta_data = response[0]["universe"]
         asset_contexts = response[1]
 
-        # Handle both prefixed symbols (xyz:GOLD) and non-prefixed (BTC)
-        asset_names = {}
-        for i, asset in enumerate(meta_data):
-            full_name = asset["name"]
-            # Extract base name after colon if present
-            base_name = full_name.split(":")[-1]
-            asset_names[i] = base_name
+        # Contexts are positionally aligned with the universe listing; if the lengths
+        # disagree the pairing can't be trusted, so skip this round rather than mis-assign
+        if len(meta_data) != len(asset_contexts):
+            self.logger_live.error(
+                f"metaAndAssetCtxs length mismatch: {len(meta_data)} assets, "
+                f"{len(asset_contexts)} contexts; skipping live rates"
+            )
+            return {}
 
+        # Handle both prefixed symbols (xyz:GOLD) and non-prefixed (BTC)
         now = datetime.now()
-        rates = {}
-        for idx, ctx in enumerate(asset_contexts):
-            if "funding" in ctx:
-                asset_name = asset_names[idx]
-                rates[asset_name] = FundingPoint(
-                    rate=float(ctx["funding"]),
-                    timestamp=now,
-                )
-
-        return rates
+        return {
+            asset["name"].rpartition(":")[2]: FundingPoint(
+                rate=float(ctx["funding"]), timestamp=now
+            )
+            for asset, ctx in zip(meta_data, asset_contexts, strict=True)
+            if "funding" in ctx
+        }
 
     async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
+        # Rates are keyed by database asset name (sub-dex prefix stripped), not API symbol
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, lambda c: c.asset.name)
@@ -19,7 +19,18 @@ _SYMBOL_MAP: dict[str, str] = {
 }
 
 # Reverse mapping: database symbol -> API symbol
-_REVERSE_MAP: dict[str, str] = {v: k for k, v in _SYMBOL_MAP.items()}
+_REVERSE_MAP: dict[str, str] = dict(zip(_SYMBOL_MAP.values(), _SYMBOL_MAP.keys(), strict=True))
+
+# Memoized API name -> database symbol ("xyz:GOLD" -> "XAU", "GOLD" -> "XAU")
+_DB_SYMBOLS: dict[str, str] = {}
+
+
+def _to_db_symbol(api_name: str) -> str:
+    db_symbol = _DB_SYMBOLS.get(api_name)
+    if db_symbol is None:
+        base_name = api_name.rpartition(":")[2]
+        db_symbol = _DB_SYMBOLS[api_name] = _SYMBOL_MAP.get(base_name, base_name)
+    return db_symbol
 
 
 class HyperliquidXyzExchange(HyperliquidExchange):
@@ -38,42 +49,20 @@ class HyperliquidXyzExchange(HyperliquidExchange):
         # Call parent to get raw data with dex=xyz
         raw_contracts = await super().get_contracts()
 
-        # Apply symbol mapping (GOLD -> XAU)
-        mapped_contracts = []
-        for contract in raw_contracts:
-            asset_part = contract.asset_name.split(":")[-1]  # Extract "GOLD" from "xyz:GOLD"
-            mapped_name = _SYMBOL_MAP.get(asset_part, asset_part)
-
-            mapped_contracts.append(
-                ContractInfo(
-                    asset_name=mapped_name,
-                    quote=contract.quote,
-                    funding_interval=contract.funding_interval,
-                    section_name=self.EXCHANGE_ID,
-                )
+        # Apply symbol mapping (xyz:GOLD -> XAU)
+        return [
+            ContractInfo(
+                asset_name=_to_db_symbol(contract.asset_name),
+                quote=contract.quote,
+                funding_interval=contract.funding_interval,
+                section_name=self.EXCHANGE_ID,
             )
-
-        return mapped_contracts
+            for contract in raw_contracts
+        ]
 
     async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
         # Call parent to get rates with dex=xyz
         raw_rates = await super()._fetch_all_rates()
 
         # Map keys from GOLD/SILVER to XAU/XAG to match get_contracts()
-        mapped_rates = {}
-        for symbol, rate_point in raw_rates.items():
-            mapped_name = _SYMBOL_MAP.get(symbol, symbol)
-            mapped_rates[mapped_name] = rate_point
-
-        return mapped_rates
-
-    async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        # Use database symbol (XAU) as key, not API format (xyz:GOLD)
-        symbol_to_contract = {c.asset.name: c for c in contracts}
-        all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return {_to_db_symbol(symbol): rate_point for symbol, rate_point in raw_rates.items()}
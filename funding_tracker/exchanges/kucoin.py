@@ -2,15 +2,21 @@
 
 KuCoin has mixed funding intervals (1h, 4h, 8h). Minimum is 1 hour.
 _FETCH_STEP = 100 hours (empirically tested).
+
+Contracts and live rates both come from /contracts/active; one response is reused
+for a few seconds so a contract sync and a live poll firing together share a request.
 """
 
 import logging
+import time
 from datetime import datetime
+from typing import Any
 
 from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -25,19 +31,32 @@ class KucoinExchange(BaseExchange):
     # Empirically tested
     _FETCH_STEP = 100
 
+    # Seconds a /contracts/active response is reused
+    _ACTIVE_CONTRACTS_TTL = 5.0
+
+    def __init__(self) -> None:
+        self._active_contracts: list[dict[str, Any]] = []
+        self._active_contracts_fetched_at = float("-inf")
+
     def _format_symbol(self, contract: Contract) -> str:
         return f"{contract.asset.name}{contract.quote_name}M"
 
-    async def get_contracts(self) -> list[ContractInfo]:
-        response = await http_client.get(f"{self.API_ENDPOINT}/api/v1/contracts/active")
+    async def _fetch_active_contracts(self) -> list[dict[str, Any]]:
+        if time.monotonic() - self._active_contracts_fetched_at < self._ACTIVE_CONTRACTS_TTL:
+            return self._active_contracts
 
-        assert isinstance(response, dict)
+        response: Any = await http_client.get(f"{self.API_ENDPOINT}/api/v1/contracts/active")
 
         if response.get("code") != "200000":
             raise RuntimeError(f"KuCoin API error: {response}")
 
+        self._active_contracts = response.get("data", [])
+        self._active_contracts_fetched_at = time.monotonic()
+        return self._active_contracts
+
+    async def get_contracts(self) -> list[ContractInfo]:
         contracts = []
-        raw_contracts = response.get("data", [])
+        raw_contracts = await self._fetch_active_contracts()
 
         for contract in raw_contracts:
             if contract["status"] != "Open":
@@ -50,7 +69,7 @@ class KucoinExchange(BaseExchange):
 
             asset_name = contract["baseCurrency"]
             quote = contract["quoteCurrency"]
-            funding_interval = int(funding_interval_ms / 1000 / 3600)
+            funding_interval = funding_interval_ms // 3_600_000
 
             contracts.append(
                 ContractInfo(
@@ -68,7 +87,7 @@ class KucoinExchange(BaseExchange):
     ) -> list[FundingPoint]:
         symbol = self._format_symbol(contract)
 
-        response = await http_client.get(
+        response: Any = await http_client.get(
             f"{self.API_ENDPOINT}/api/v1/contract/funding-rates",
             params={
                 "symbol": symbol,
@@ -77,32 +96,23 @@ class KucoinExchange(BaseExchange):
             },
         )
 
-        assert isinstance(response, dict)
-
         if response.get("code") != "200000":
             raise RuntimeError(f"KuCoin API error for {symbol}: {response}")
 
-        points = []
-        raw_records = response.get("data") or []
-
-        for raw_record in raw_records:
-            rate = float(raw_record["fundingRate"])
-            timestamp = datetime.fromtimestamp(int(raw_record["timepoint"]) / 1000.0)
-            points.append(FundingPoint(rate=rate, timestamp=timestamp))
-
-        return points
+        fromtimestamp = datetime.fromtimestamp
+        return [
+            FundingPoint(
+                rate=float(raw_record["fundingRate"]),
+                timestamp=fromtimestamp(int(raw_record["timepoint"]) / 1000.0),
+            )
+            for raw_record in response.get("data") or []
+        ]
 
     async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
-        response = await http_client.get(f"{self.API_ENDPOINT}/api/v1/contracts/active")
-
-        assert isinstance(response, dict)
-
-        if response.get("code") != "200000":
-            raise RuntimeError(f"KuCoin API error: {response}")
+        raw_contracts = await self._fetch_active_contracts()
 
         now = datetime.now()
         rates = {}
-        raw_contracts = response.get("data", [])
 
         for contract in raw_contracts:
             if contract["status"] != "Open":
@@ -124,11 +134,5 @@ class KucoinExchange(BaseExchange):
         return rates
 
     async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
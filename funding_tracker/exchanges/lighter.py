@@ -2,17 +2,25 @@
 
 Lighter uses 1-hour funding interval. API limit is 500 records per request.
 _FETCH_STEP = 498 hours (500 - 2 safety buffer).
+
+Live rates come from a long-lived market_stats/all WebSocket subscription.
+A background reader keeps the latest rate per market; each poll snapshots it.
 """
 
+import asyncio
 import json
 import logging
+import time
 from datetime import datetime
+from typing import Any
 
+import orjson
 import websockets
 from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -28,16 +36,23 @@ class LighterExchange(BaseExchange):
     # 500 records max, 1-hour interval -> 498 hours (500 - 2 safety buffer)
     _FETCH_STEP = 498
 
+    # Reconnect if the stream has been silent this long; wait this long for first frame
+    _WS_STALE_AFTER = 120.0
+    _WS_READY_TIMEOUT = 30.0
+
     def __init__(self) -> None:
         self._asset_to_id: dict[str, int] = {}
+        # Latest raw rate per market_id, written only by the stream reader task
+        self._live_rates: dict[str, float] = {}
+        self._live_rates_ready = asyncio.Event()
+        self._last_message_at = 0.0
+        self._stream_task: asyncio.Task[None] | None = None
 
     def _format_symbol(self, contract: Contract) -> str:
         return str(self._asset_to_id[contract.asset.name])
 
     async def get_contracts(self) -> list[ContractInfo]:
-        response = await http_client.get(f"{self.API_ENDPOINT}/orderBooks")
-
-        assert isinstance(response, dict)
+        response: Any = await http_client.get(f"{self.API_ENDPOINT}/orderBooks")
 
         contracts = []
         asset_to_id = {}
@@ -64,7 +79,7 @@ class LighterExchange(BaseExchange):
     ) -> list[FundingPoint]:
         symbol = self._format_symbol(contract)
 
-        response = await http_client.get(
+        response: Any = await http_client.get(
             f"{self.API_ENDPOINT}/fundings",
             params={
                 "market_id": int(symbol),
@@ -75,8 +90,6 @@ class LighterExchange(BaseExchange):
             },
         )
 
-        assert isinstance(response, dict)
-
         points = []
         raw_records = response.get("fundings", [])
 
@@ -89,34 +102,72 @@ class LighterExchange(BaseExchange):
 
         return points
 
-    async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
-        rates = {}
+    async def _stream_market_stats(self) -> None:
+        """Keep _live_rates up to date from market_stats/all; reconnects on close."""
+        async for websocket in websockets.connect(self.WS_ENDPOINT):
+            try:
+                await websocket.send(
+                    json.dumps({"type": "subscribe", "channel": "market_stats/all"})
+                )
+                async for message in websocket:
+                    self._last_message_at = time.monotonic()
+                    # "connected" and other control messages carry no market_stats
+                    market_stats = orjson.loads(message).get("market_stats")
+                    if not market_stats:
+                        continue
+
+                    for market_id, payload in market_stats.items():
+                        funding_rate = payload.get("current_funding_rate")
+                        if funding_rate is not None:
+                            self._live_rates[market_id] = float(funding_rate) / 100
+                    self._live_rates_ready.set()
+            except websockets.ConnectionClosed:
+                # Rates from the dropped connection would be restamped as fresh on every fetch
+                self._live_rates.clear()
+                self._live_rates_ready.clear()
+                self.logger_live.debug("market_stats stream closed, reconnecting")
+
+    def _on_stream_done(self, task: asyncio.Task[None]) -> None:
+        """Retrieve and log the reader's failure so it is neither lost nor reported unretrieved."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            self.logger_live.error(
+                f"market_stats stream failed: {exc!r}",
+                exc_info=(type(exc), exc, exc.__traceback__),
+            )
 
-        async with websockets.connect(self.WS_ENDPOINT) as websocket:
-            await websocket.send(json.dumps({"type": "subscribe", "channel": "market_stats/all"}))
+    async def _ensure_stream(self) -> None:
+        """Start the stream reader, or restart it if it died or went silent."""
+        task = self._stream_task
+        if task is not None and not task.done():
+            if time.monotonic() - self._last_message_at <= self._WS_STALE_AFTER:
+                return
+            self.logger_live.warning("market_stats stream stalled, restarting")
+            task.cancel()
+            # Let the old reader finish unwinding (closing its socket) before replacing it
+            await asyncio.wait([task])
+
+        self._live_rates.clear()
+        self._live_rates_ready.clear()
+        self._last_message_at = time.monotonic()
+        self._stream_task = asyncio.create_task(self._stream_market_stats())
+        self._stream_task.add_done_callback(self._on_stream_done)
 
-            # Skip "connected" message, get first data message
-            await websocket.recv()
-            message = await websocket.recv()
-            data = json.loads(message)
+    async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
+        await self._ensure_stream()
 
-            market_stats = data.get("market_stats", {})
-            for market_id, payload in market_stats.items():
-                funding_rate = payload.get("current_funding_rate")
-                if funding_rate is not None:
-                    # WebSocket returns string keys, convert to int for consistency
-                    rates[market_id] = FundingPoint(
-                        rate=float(funding_rate) / 100, timestamp=datetime.now()
-                    )
+        async with asyncio.timeout(self._WS_READY_TIMEOUT):
+            await self._live_rates_ready.wait()
 
-        return rates
+        now = datetime.now()
+        # WebSocket returns string market_id keys, matching _format_symbol()
+        return {
+            market_id: FundingPoint(rate=rate, timestamp=now)
+            for market_id, rate in self._live_rates.items()
+        }
 
     async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._format_symbol)
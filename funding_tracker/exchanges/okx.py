@@ -2,6 +2,8 @@
 
 OKX uses 1-8 hour funding intervals (most contracts are 8h). API limit is 400 records per request.
 _FETCH_STEP = 398 hours (400 - 2 safety buffer).
+
+Live rates use batch API: /public/funding-rate with instId=ANY returns all swaps at once.
 """
 
 import logging
@@ -12,6 +14,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -40,7 +43,8 @@ class OkxExchange(BaseExchange):
             for instrument in response["data"]:
                 if instrument["state"] == "live":
                     # Parse "BTC-USDT-SWAP" format
-                    asset_name, quote, _ = instrument["instId"].split("-")
+                    asset_name, _, tail = instrument["instId"].partition("-")
+                    quote, _, _ = tail.partition("-")
                     contracts.append(
                         ContractInfo(
                             asset_name=asset_name,
@@ -68,33 +72,36 @@ class OkxExchange(BaseExchange):
             },
         )
 
-        points = []
-        if response.get("code") == "0" and response.get("data"):
-            for raw_record in response["data"]:
-                rate = float(raw_record["fundingRate"])
-                timestamp = datetime.fromtimestamp(int(raw_record["fundingTime"]) / 1000.0)
-                points.append(FundingPoint(rate=rate, timestamp=timestamp))
-
-        return points
+        if response.get("code") != "0":
+            return []
 
-    async def _fetch_live_single(self, contract: Contract) -> FundingPoint:
-        symbol = self._format_symbol(contract)
+        fromtimestamp = datetime.fromtimestamp
+        return [
+            FundingPoint(
+                rate=float(raw_record["fundingRate"]),
+                timestamp=fromtimestamp(int(raw_record["fundingTime"]) / 1000.0),
+            )
+            for raw_record in response.get("data") or []
+        ]
 
+    async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
         response: Any = await http_client.get(
             f"{self.API_ENDPOINT}/public/funding-rate",
-            params={"instId": symbol},
+            params={"instId": "ANY"},
         )
 
-        data = response.get("data")
-        if not data:
-            raise ValueError(f"No funding rate data for {symbol}")
+        if response.get("code") != "0":
+            raise RuntimeError(f"OKX API error: {response}")
 
-        record = data[0]
         now = datetime.now()
-        rate = float(record["fundingRate"])
-        return FundingPoint(rate=rate, timestamp=now)
+        rates = {}
+        for record in response.get("data") or []:
+            funding_rate = record.get("fundingRate")
+            if funding_rate:
+                rates[record["instId"]] = FundingPoint(rate=float(funding_rate), timestamp=now)
 
-    async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        from funding_tracker.exchanges.utils import fetch_live_parallel
+        return rates
 
-        return await fetch_live_parallel(self, contracts)
+    async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
+        all_rates = await self._fetch_all_rates()
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
@@ -13,6 +13,7 @@ from quantshark_shared.models.contract import Contract
 
 from funding_tracker.exchanges.base import BaseExchange
 from funding_tracker.exchanges.dto import ContractInfo, FundingPoint
+from funding_tracker.exchanges.utils import match_live_rates
 from funding_tracker.infrastructure import http_client
 
 logger = logging.getLogger(__name__)
@@ -33,13 +34,10 @@ class PacificaExchange(BaseExchange):
     async def get_contracts(self) -> list[ContractInfo]:
         response: Any = await http_client.get(f"{self.API_ENDPOINT}/info")
 
-        assert isinstance(response, dict)
-
         if not response.get("success") or not response.get("data"):
             return []
 
         data = response["data"]
-        assert isinstance(data, list)
 
         contracts = []
         for item in data:
@@ -60,30 +58,23 @@ class PacificaExchange(BaseExchange):
     ) -> list[FundingPoint]:
         symbol = self._format_symbol(contract)
 
-        points = []
-        cursor = None
-
-        while True:
-            params = {"symbol": symbol, "limit": 1000}
+        url = f"{self.API_ENDPOINT}/funding_rate/history"
+        params: dict[str, Any] = {"symbol": symbol, "limit": 1000}
 
-            if cursor:
-                params["cursor"] = cursor
-
-            response: Any = await http_client.get(
-                f"{self.API_ENDPOINT}/funding_rate/history",
-                params=params,
-            )
+        points: list[FundingPoint] = []
+        append_point = points.append
+        fromtimestamp = datetime.fromtimestamp
 
-            assert isinstance(response, dict)
+        while True:
+            response: Any = await http_client.get(url, params=params)
 
             if not response.get("success") or not response.get("data"):
                 break
 
             records = response["data"]
-            assert isinstance(records, list)
 
             # Parse records (DESC order: newest first)
-            batch_points = []
+            reached_start = False
             for raw_record in records:
                 timestamp_ms = raw_record["created_at"]
 
@@ -91,22 +82,24 @@ class PacificaExchange(BaseExchange):
                 if timestamp_ms > end_ms:
                     continue
                 if timestamp_ms < start_ms:
+                    reached_start = True
                     break
 
                 rate = float(raw_record["funding_rate"])
-                timestamp = datetime.fromtimestamp(timestamp_ms / 1000.0)
-                batch_points.append(FundingPoint(rate=rate, timestamp=timestamp))
+                timestamp = fromtimestamp(timestamp_ms / 1000.0)
+                append_point(FundingPoint(rate=rate, timestamp=timestamp))
 
-            points.extend(batch_points)
+            # Later pages are older still, so nothing more falls in range
+            if reached_start:
+                break
 
-            # Check pagination
+            # Check for more pages
             has_more = response.get("has_more", False)
             next_cursor = response.get("next_cursor")
-
             if not has_more or not next_cursor:
                 break
 
-            cursor = next_cursor
+            params["cursor"] = next_cursor
 
             # Safety check
             if len(points) >= 4000:
@@ -117,8 +110,6 @@ class PacificaExchange(BaseExchange):
     async def _fetch_all_rates(self) -> dict[str, FundingPoint]:
         response: Any = await http_client.get(f"{self.API_ENDPOINT}/info/prices")
 
-        assert isinstance(response, dict)
-
         if not response.get("success") or not response.get("data"):
             return {}
 
@@ -126,7 +117,6 @@ class PacificaExchange(BaseExchange):
         rates = {}
 
         data = response["data"]
-        assert isinstance(data, list)
 
         for item in data:
             symbol = item["symbol"]
@@ -139,11 +129,5 @@ class PacificaExchange(BaseExchange):
         return rates
 
     async def fetch_live(self, contracts: list[Contract]) -> dict[Contract, FundingPoint]:
-        symbol_to_contract = {self._format_symbol(c): c for c in contracts}
         all_rates = await self._fetch_all_rates()
-
-        return {
-            symbol_to_contract[symbol]: rate
-            for symbol, rate in all_rates.items()
-            if symbol in symbol_to_contract
-        }
+        return match_live_rates(contracts, all_rates, self._cached_symbol)
@@ -31,8 +31,12 @@ _FETCH_STEP = 6 hours = 4320 records (5000 limit - safety buffer).
 - Timestamp: 15:00:00 (end of hour)
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
 
 from quantshark_shared.models.contract import Contract
 
@@ -52,18 +56,28 @@ class ParadexExchange(BaseExchange):
     # 6 hours * 720 records/hour = 4320 records (safely under 5000 limit)
     _FETCH_STEP = 6
 
-    # Live cache: {contract_id: {hour_start_ms: [rates]}}
+    _HOUR_MS = 3_600_000
+
+    # Live requests are multiplexed over one HTTP/2 connection, so more can be in flight
+    LIVE_CONCURRENCY = 50
+
+    # Concurrent range requests per fetch_history_after call (kept low to avoid rate limits)
+    _HISTORY_CONCURRENCY = 5
+
+    # Live cache: {(contract_id, hour_start_ms): [rate_sum, record_count]}
     # Stores live funding records collected every minute for fetch_after optimization
-    # Cache entries are automatically removed via pop() when used in fetch_history_after
-    _live_cache: dict[str, dict[int, list[float]]] = {}
+    # Cache entries are automatically removed via pop() when used in fetch_history_after;
+    # buckets never consumed are swept once older than _LIVE_CACHE_MAX_AGE_MS
+    _live_cache: dict[tuple[UUID, int], list[float]] = {}
+    _live_cache_swept_ms = 0
+
+    _LIVE_CACHE_MAX_AGE_MS = 24 * 3_600_000
 
     def _format_symbol(self, contract: Contract) -> str:
         return f"{contract.asset.name}-USD-PERP"
 
     async def get_contracts(self) -> list[ContractInfo]:
-        response = await http_client.get(f"{self.API_ENDPOINT}/markets")
-
-        assert isinstance(response, dict)
+        response: Any = await http_client.get(f"{self.API_ENDPOINT}/markets")
         markets = response["results"]
 
         contracts = []
@@ -116,13 +130,13 @@ class ParadexExchange(BaseExchange):
         start_ms = int(start_time.timestamp() * 1000)
         end_ms = int(end_time.timestamp() * 1000)
 
-        symbol = self._format_symbol(contract)
+        symbol = self._cached_symbol(contract)
 
         logger.debug(
             f"Fetching history for {self.EXCHANGE_ID}/{symbol} from {start_time} to {end_time}"
         )
 
-        response = await http_client.get(
+        response: Any = await http_client.get(
             f"{self.API_ENDPOINT}/funding/data",
             params={
                 "market": symbol,
@@ -132,7 +146,6 @@ class ParadexExchange(BaseExchange):
             },
         )
 
-        assert isinstance(response, dict)
         raw_records = response["results"]
 
         if not raw_records:
@@ -161,7 +174,8 @@ class ParadexExchange(BaseExchange):
         1. Split time range into hours
         2. For each hour, check live cache (collected by fetch_live every minute)
         3. If cache has 50+ records: use cached average
-        4. If cache has <50 records: fetch from API (same logic as fetch_history_before)
+        4. Collapse remaining hours into consecutive runs, one API request per run,
+           fetched concurrently
 
         This optimization works because live collector runs every minute,
         accumulating ~60 records/hour. Using cached data avoids API calls for
@@ -174,73 +188,50 @@ class ParadexExchange(BaseExchange):
         Returns:
             List of hourly FundingPoint objects in chronological order
         """
-        now = datetime.now()
-        start = after_timestamp
-        contract_id = str(contract.id)
-
-        # Align to hour boundaries
-        start = start.replace(minute=0, second=0, microsecond=0)
-        now = now.replace(minute=0, second=0, microsecond=0)
+        hour_ms = self._HOUR_MS
 
-        # Generate list of hours to fetch
-        hours_to_fetch = []
-        current = start + timedelta(hours=1)  # Start with next hour after after_timestamp
-        while current <= now:
-            hours_to_fetch.append(current)
-            current += timedelta(hours=1)
+        # Align to hour boundaries in epoch ms, starting with the hour after after_timestamp
+        start_ms = int(after_timestamp.timestamp() * 1000) // hour_ms * hour_ms + hour_ms
+        now_ms = int(time.time() * 1000) // hour_ms * hour_ms
 
-        if not hours_to_fetch:
+        if start_ms > now_ms:
             return []
 
-        symbol = self._format_symbol(contract)
+        symbol = self._cached_symbol(contract)
         all_points = []
+        miss_hours_ms = []
 
-        for hour_end in hours_to_fetch:
-            hour_start = hour_end - timedelta(hours=1)
-            hour_start_ms = int(hour_start.timestamp() * 1000)
-
+        for hour_end_ms in range(start_ms, now_ms + 1, hour_ms):
             # Check live cache and remove entry (pop) - cache auto-cleans when used
-            cached_rates = self._live_cache.get(contract_id, {}).pop(hour_start_ms, None)
+            rate_sum, count = self._live_cache.pop((contract.id, hour_end_ms - hour_ms), (0.0, 0))
 
-            if cached_rates and len(cached_rates) >= 50:
+            if count >= 50:
                 # Use cached average
-                avg_cached = sum(cached_rates) / len(cached_rates)
+                avg_cached = rate_sum / count
                 hourly_rate = avg_cached / 8  # Convert 8-hour period to hourly
+                hour_end = datetime.fromtimestamp(hour_end_ms / 1000)
 
                 all_points.append(FundingPoint(rate=hourly_rate, timestamp=hour_end))
 
                 logger.debug(
                     f"Using cached average for {self.EXCHANGE_ID}/{symbol} "
-                    f"hour {hour_end} ({len(cached_rates)} records)"
+                    f"hour {hour_end} ({count} records)"
                 )
             else:
-                # Fetch from API
-                hour_end_ms = int(hour_end.timestamp() * 1000)
-
-                response = await http_client.get(
-                    f"{self.API_ENDPOINT}/funding/data",
-                    params={
-                        "market": symbol,
-                        "start_at": hour_start_ms,
-                        "end_at": hour_end_ms,
-                        "page_size": 1000,  # 1 hour = 720 records, safety margin
-                    },
-                )
+                miss_hours_ms.append(hour_end_ms)
 
-                assert isinstance(response, dict)
-                raw_records = response["results"]
+        # Fetch runs of consecutive cache misses concurrently, one range request per run
+        semaphore = asyncio.Semaphore(self._HISTORY_CONCURRENCY)
 
-                if raw_records:
-                    # Aggregate this hour's records
-                    hour_points = self._aggregate_to_hourly(raw_records)
+        async def fetch_run(run_start_ms: int, run_end_ms: int) -> list[FundingPoint]:
+            async with semaphore:
+                return await self._fetch_hour_run(symbol, run_start_ms, run_end_ms)
 
-                    if hour_points:
-                        all_points.extend(hour_points)
+        runs = self._group_hour_runs(miss_hours_ms)
+        for run_points in await asyncio.gather(*(fetch_run(*run) for run in runs)):
+            all_points.extend(run_points)
 
-                        logger.debug(
-                            f"Fetched from API for {self.EXCHANGE_ID}/{symbol} "
-                            f"hour {hour_end} ({len(raw_records)} records)"
-                        )
+        all_points.sort(key=lambda point: point.timestamp)
 
         logger.debug(
             f"Fetched {len(all_points)} hourly points for {self.EXCHANGE_ID}/{symbol} "
@@ -249,13 +240,65 @@ class ParadexExchange(BaseExchange):
 
         return all_points
 
+    async def _fetch_hour_run(
+        self, symbol: str, run_start_ms: int, run_end_ms: int
+    ) -> list[FundingPoint]:
+        """Fetch and aggregate one window of consecutive hours with a single range request."""
+        response: Any = await http_client.get(
+            f"{self.API_ENDPOINT}/funding/data",
+            params={
+                "market": symbol,
+                "start_at": run_start_ms,
+                "end_at": run_end_ms,
+                "page_size": 5000,
+            },
+        )
+
+        raw_records = response["results"]
+
+        if not raw_records:
+            return []
+
+        run_start = datetime.fromtimestamp(run_start_ms / 1000)
+        run_end = datetime.fromtimestamp(run_end_ms / 1000)
+
+        logger.debug(
+            f"Fetched from API for {self.EXCHANGE_ID}/{symbol} "
+            f"hours {run_start} to {run_end} ({len(raw_records)} records)"
+        )
+
+        # Drop the bucket a record exactly on run_end would open past the run
+        return [
+            point
+            for point in self._aggregate_to_hourly(raw_records)
+            if run_start < point.timestamp <= run_end
+        ]
+
+    def _group_hour_runs(self, hour_ends_ms: list[int]) -> list[tuple[int, int]]:
+        """Collapse sorted hour ends (epoch ms) into (start_ms, end_ms) consecutive windows.
+
+        Windows are capped at _FETCH_STEP hours so each stays under the 5000-record page.
+        """
+        max_span_ms = self._FETCH_STEP * self._HOUR_MS
+        runs: list[tuple[int, int]] = []
+        for hour_end_ms in hour_ends_ms:
+            if (
+                runs
+                and runs[-1][1] + self._HOUR_MS == hour_end_ms
+                and hour_end_ms - runs[-1][0] <= max_span_ms
+            ):
+                runs[-1] = (runs[-1][0], hour_end_ms)
+            else:
+                runs.append((hour_end_ms - self._HOUR_MS, hour_end_ms))
+        return runs
+
     def _aggregate_to_hourly(self, raw_records: list[dict]) -> list[FundingPoint]:
         """Aggregate raw 5-second records to hourly averages.
 
         Paradex API returns funding rate updates every ~5 seconds.
         Each record contains a raw 8-hour cumulative rate.
         We need to:
-        1. Group records by hour
+        1. Group records by hour (sum and count per bucket)
         2. Average all records in each hour
         3. Divide by 8 to get hourly rate
 
@@ -265,35 +308,24 @@ class ParadexExchange(BaseExchange):
         Returns:
             List of hourly FundingPoint objects
         """
-        # Group by hour
-        hourly_groups: dict[int, list[float]] = {}
+        # Bucket by end-of-hour epoch ms with integer math and keep running sums,
+        # so no datetime is built per record and no per-hour rate list is kept
+        sums: dict[int, float] = {}
+        counts: dict[int, int] = {}
 
         for record in raw_records:
-            created_at_ms = record["created_at"]
-            rate = float(record["funding_rate"])
-
-            # Find hour boundary (end of hour)
-            hour_end_dt = datetime.fromtimestamp(created_at_ms / 1000)
-            hour_end_dt = hour_end_dt.replace(minute=0, second=0, microsecond=0) + timedelta(
-                hours=1
+            hour_end_ms = (record["created_at"] // self._HOUR_MS + 1) * self._HOUR_MS
+            sums[hour_end_ms] = sums.get(hour_end_ms, 0.0) + float(record["funding_rate"])
+            counts[hour_end_ms] = counts.get(hour_end_ms, 0) + 1
+
+        # Convert 8-hour period averages to hourly; datetimes only per bucket
+        return [
+            FundingPoint(
+                rate=sums[hour_end_ms] / counts[hour_end_ms] / 8,
+                timestamp=datetime.fromtimestamp(hour_end_ms / 1000),
             )
-            hour_end_ms = int(hour_end_dt.timestamp() * 1000)
-
-            if hour_end_ms not in hourly_groups:
-                hourly_groups[hour_end_ms] = []
-            hourly_groups[hour_end_ms].append(rate)
-
-        # Calculate hourly averages
-        points = []
-        for hour_end_ms in sorted(hourly_groups.keys()):
-            rates = hourly_groups[hour_end_ms]
-            avg_rate = sum(rates) / len(rates)
-            hourly_rate = avg_rate / 8  # Convert 8-hour period to hourly
-
-            hour_end_dt = datetime.fromtimestamp(hour_end_ms / 1000)
-            points.append(FundingPoint(rate=hourly_rate, timestamp=hour_end_dt))
-
-        return points
+            for hour_end_ms in sorted(sums)
+        ]
 
     async def _fetch_history(
         self, contract: Contract, start_ms: int, end_ms: int
@@ -317,10 +349,9 @@ class ParadexExchange(BaseExchange):
         Note: Paradex doesn't have a dedicated "current rate" endpoint.
         We fetch the most recent historical record (page_size=1).
         """
-        symbol = self._format_symbol(contract)
-        contract_id = str(contract.id)
+        symbol = self._cached_symbol(contract)
 
-        response = await http_client.get(
+        response: Any = await http_client.get(
             f"{self.API_ENDPOINT}/funding/data",
             params={
                 "market": symbol,
@@ -328,7 +359,6 @@ class ParadexExchange(BaseExchange):
             },
         )
 
-        assert isinstance(response, dict)
         data = response["results"]
 
         if not data:
@@ -339,15 +369,19 @@ class ParadexExchange(BaseExchange):
 
         # Store in live cache for fetch_after optimization
         now = datetime.now()
-        hour_start = now.replace(minute=0, second=0, microsecond=0)
-        hour_start_ms = int(hour_start.timestamp() * 1000)
+        hour_start_ms = int(now.timestamp() * 1000) // self._HOUR_MS * self._HOUR_MS
 
-        if contract_id not in self._live_cache:
-            self._live_cache[contract_id] = {}
-        if hour_start_ms not in self._live_cache[contract_id]:
-            self._live_cache[contract_id][hour_start_ms] = []
+        if hour_start_ms > self._live_cache_swept_ms:
+            # First tick of a new hour: drop stale buckets fetch_history_after never consumed
+            cutoff_ms = hour_start_ms - self._LIVE_CACHE_MAX_AGE_MS
+            for key in [key for key in self._live_cache if key[1] < cutoff_ms]:
+                del self._live_cache[key]
+            self._live_cache_swept_ms = hour_start_ms
 
-        self._live_cache[contract_id][hour_start_ms].append(raw_rate)
+        # Running sum and count: fetch_history_after only needs the hourly mean
+        entry = self._live_cache.setdefault((contract.id, hour_start_ms), [0.0, 0])
+        entry[0] += raw_rate
+        entry[1] += 1
 
         # Divide by 8 for hourly rate
         hourly_rate = raw_rate / 8
@@ -355,7 +389,7 @@ class ParadexExchange(BaseExchange):
         self.logger_live.debug(
             f"Fetched live rate for {symbol}: {hourly_rate:.8f} "
             f"(cached, hour bucket now has "
-            f"{len(self._live_cache[contract_id][hour_start_ms])} records)"
+            f"{entry[1]} records)"
         )
 
         return FundingPoint(rate=hourly_rate, timestamp=now)
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -36,13 +37,31 @@ def from_sec_timestamp(sec: int) -> datetime:
     return datetime.fromtimestamp(sec)
 
 
+def match_live_rates(
+    contracts: list[Contract],
+    rates: dict[str, FundingPoint],
+    symbol_of: Callable[[Contract], str],
+) -> dict[Contract, FundingPoint]:
+    """Map batch-fetched rates (keyed by exchange symbol) back to contracts.
+
+    Probes rates per contract, so no symbol -> contract index is rebuilt on every poll.
+    Contracts missing from rates are omitted.
+    """
+    return {
+        contract: rate
+        for contract in contracts
+        if (rate := rates.get(symbol_of(contract))) is not None
+    }
+
+
 async def fetch_live_parallel(
     exchange: "BaseExchange",
     contracts: list[Contract],
 ) -> dict[Contract, FundingPoint]:
     """Fetch live rates using parallel individual API calls.
 
-    Executes requests concurrently with semaphore-controlled rate limiting.
+    Executes requests concurrently, rate limited by the adapter's shared
+    live_semaphore (at most LIVE_CONCURRENCY requests in flight across calls).
     Returns dict of successfully fetched contracts; logs and filters failures.
     """
 
@@ -61,7 +80,7 @@ async def fetch_live_parallel(
                 )
                 return None
 
-    semaphore = asyncio.Semaphore(10)
+    semaphore = exchange.live_semaphore
     tasks = [fetch_one(contract) for contract in contracts]
     results = await asyncio.gather(*tasks)
 
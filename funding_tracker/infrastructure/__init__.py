@@ -1,5 +1,5 @@
 """Infrastructure layer: HTTP client with retry logic."""
 
-from funding_tracker.infrastructure.http_client import get, post
+from funding_tracker.infrastructure.http_client import close, get, post
 
-__all__ = ["get", "post"]
+__all__ = ["close", "get", "post"]
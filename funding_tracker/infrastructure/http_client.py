@@ -1,9 +1,16 @@
-"""HTTP client with exponential backoff retry."""
+"""HTTP client with exponential backoff retry and orjson response decoding.
+
+All requests share one process-wide httpx.AsyncClient so keep-alive connections
+(and their TLS sessions) are reused across adapters and polls. HTTP/2 is negotiated
+where the server supports it, multiplexing concurrent per-contract requests over
+one connection per host.
+"""
 
 import logging
 from typing import Any
 
 import httpx
+import orjson
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -16,6 +23,30 @@ logger = logging.getLogger(__name__)
 # JSON can be any of these types
 JsonValue = dict[str, Any] | list[Any] | str | int | float | bool | None
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared pool: bounded overall, idle connections kept warm between minute-level polls
+_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=90)
+
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use (or after close())."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(http2=True, limits=_LIMITS)
+    return _client
+
+
+async def close() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 # Retry on errors: stop after 60s, exponential backoff (max 10s)
 RETRY_CONFIG = {
     "retry": retry_if_exception_type((httpx.HTTPError, httpx.TimeoutException)),
@@ -32,10 +63,9 @@ async def get(
     headers: dict[str, str] | None = None,
     timeout: float = 30.0,
 ) -> JsonValue:
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    response = await _get_client().get(url, params=params, headers=headers, timeout=timeout)
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
 @retry(**RETRY_CONFIG)
@@ -45,7 +75,12 @@ async def post(
     headers: dict[str, str] | None = None,
     timeout: float = 30.0,
 ) -> JsonValue:
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(url, json=json, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    # Encode body with orjson instead of httpx's stdlib json encoder
+    response = await _get_client().post(
+        url,
+        content=orjson.dumps(json) if json is not None else None,
+        headers={**_JSON_HEADERS, **(headers or {})},
+        timeout=timeout,
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
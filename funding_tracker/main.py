@@ -7,20 +7,22 @@ import logging
 import os
 import sys
 import time
+from collections.abc import Callable
 from typing import Any
 
 from dotenv import load_dotenv
 
 from funding_tracker.bootstrap import bootstrap
 from funding_tracker.cli import build_parser
-from funding_tracker.exchanges import EXCHANGES
+from funding_tracker.exchanges import EXCHANGES_SORTED
+from funding_tracker.infrastructure import http_client
 from funding_tracker.logging_setup import (
     configure_exchange_debug_logging,
     configure_live_debug_logging,
     configure_logging,
 )
 from funding_tracker.runtime import build_runtime_config
-from funding_tracker.settings import Settings
+from funding_tracker.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,18 @@ def _force_utc_timezone() -> None:
         time.tzset()
 
 
+def _event_loop_factory(use_uvloop: bool) -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when enabled and installed, else None (default loop)."""
+    if not use_uvloop:
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("FT_UVLOOP is set but uvloop is not installed, using default event loop")
+        return None
+    return uvloop.new_event_loop
+
+
 async def run_scheduler(
     db_connection: str,
     db_engine_kwargs: dict[str, Any],
@@ -47,7 +61,11 @@ async def run_scheduler(
     )
     scheduler.start()
     logger.info("Scheduler started, waiting for jobs...")
-    await asyncio.Event().wait()
+    try:
+        # Never resolved: parks until the loop is cancelled on shutdown
+        await asyncio.get_running_loop().create_future()
+    finally:
+        await http_client.close()
 
 
 def main() -> None:
@@ -58,8 +76,8 @@ def main() -> None:
     args = build_parser().parse_args()
 
     try:
-        settings = Settings()  # type: ignore[call-arg]
-        config = build_runtime_config(args=args, settings=settings, all_exchanges=set(EXCHANGES))
+        settings = get_settings()
+        config = build_runtime_config(args=args, settings=settings, all_exchanges=EXCHANGES_SORTED)
     except Exception as exc:
         sys.exit(f"Configuration error: {exc}")
 
@@ -91,7 +109,8 @@ def main() -> None:
                 config.db_engine_kwargs,
                 config.db_session_kwargs,
                 config.exchanges,
-            )
+            ),
+            loop_factory=_event_loop_factory(settings.uvloop),
         )
     except KeyboardInterrupt:
         logger.info("Application stopped by user")
@@ -1,48 +1,98 @@
 """Materialized view refresher with debouncing."""
 
+import asyncio
 import logging
-import time
 
 from funding_tracker.db import UOWFactoryType
 
 
 class MaterializedViewRefresher:
-    """Debounced refresh for materialized views."""
+    """Debounced refresh for materialized views, driven by change signals.
 
-    def __init__(self, uow_factory: UOWFactoryType, debounce_seconds: int = 10) -> None:
+    Each signal (re)arms a debounce timer; the first signal of a burst also arms a
+    max-delay timer so a continuous stream of signals still refreshes periodically.
+    Signals are counted in a generation number: refreshes that would not cover any
+    new signal are skipped, and signals that arrive during a refresh collapse into a
+    single follow-up refresh.
+    """
+
+    # Pause before the follow-up refresh for signals received during a refresh
+    _MIN_REFRESH_GAP_SECONDS = 1.0
+
+    def __init__(
+        self,
+        uow_factory: UOWFactoryType,
+        debounce_seconds: int = 10,
+        max_delay_seconds: int = 60,
+    ) -> None:
         self.uow_factory = uow_factory
         self.debounce_seconds = debounce_seconds
-        self._last_signal_time: float | None = None
-        self._pending_refresh = False
+        self.max_delay_seconds = max_delay_seconds
+        self._debounce_handle: asyncio.TimerHandle | None = None
+        self._max_delay_handle: asyncio.TimerHandle | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._generation = 0
+        self._refreshed_generation = 0
+        # Strong references so fire-and-forget refresh tasks are not garbage collected
+        self._refresh_tasks: set[asyncio.Task[None]] = set()
         self._logger = logging.getLogger(__name__)
 
     async def signal_contracts_changed(self, exchange_name: str) -> None:
-        self._last_signal_time = time.time()
-        self._pending_refresh = True
-        self._logger.debug(f"Received contracts change signal from {exchange_name}")
+        self._generation += 1
+        self._arm_debounce(self.debounce_seconds)
+
+        if self._max_delay_handle is None:
+            self._max_delay_handle = asyncio.get_running_loop().call_later(
+                self.max_delay_seconds, self._fire
+            )
+
+        self._logger.debug("Received contracts change signal from %s", exchange_name)
 
-    async def check_and_refresh_if_needed(self) -> None:
-        """Executes refresh if debounce period elapsed; retries on failure."""
-        if not self._pending_refresh or self._last_signal_time is None:
-            return
+    def _arm_debounce(self, delay: float) -> None:
+        """(Re)schedule the debounce timer to fire after delay seconds."""
+        if self._debounce_handle is not None:
+            self._debounce_handle.cancel()
+        self._debounce_handle = asyncio.get_running_loop().call_later(delay, self._fire)
 
-        time_since_last_signal = time.time() - self._last_signal_time
+    def _fire(self) -> None:
+        """Timer callback: clear pending timers and start a refresh task."""
+        for handle in (self._debounce_handle, self._max_delay_handle):
+            if handle is not None:
+                handle.cancel()
+        self._debounce_handle = None
+        self._max_delay_handle = None
+
+        task = asyncio.get_running_loop().create_task(self._refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self) -> None:
+        """Executes refresh; retries after another debounce period on failure."""
+        async with self._refresh_lock:
+            generation = self._generation
+            if generation == self._refreshed_generation:
+                self._logger.debug("Materialized views already cover all signals, skipping")
+                return
 
-        if time_since_last_signal >= self.debounce_seconds:
             try:
                 await self._refresh_materialized_views()
-                self._pending_refresh = False
-                self._last_signal_time = None
-                self._logger.info("Materialized views refresh completed")
             except Exception as e:
                 # NOTE: no error raising - this is optimisation, not critical functionality.
                 self._logger.error(
-                    f"Failed to refresh materialized views: {e}",
+                    "Failed to refresh materialized views: %s",
+                    e,
                     exc_info=True,
                 )
-        else:
-            remaining_time = self.debounce_seconds - time_since_last_signal
-            self._logger.debug(f"Waiting {remaining_time:.1f}s more before refresh")
+                if self._debounce_handle is None:
+                    self._arm_debounce(self.debounce_seconds)
+                return
+
+            self._refreshed_generation = generation
+            self._logger.info("Materialized views refresh completed")
+
+            # Signals received mid-refresh: run one follow-up soon instead of a full debounce
+            if self._generation > generation:
+                self._arm_debounce(self._MIN_REFRESH_GAP_SECONDS)
 
     async def _refresh_materialized_views(self) -> None:
         async with self.uow_factory() as uow:
@@ -1,16 +1,19 @@
 """Exchange orchestrator."""
 
 import asyncio
+import functools
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from quantshark_shared.models.contract import Contract
 
 from funding_tracker.coordinators.contract_registry import register_contracts
 from funding_tracker.coordinators.history_fetcher import sync_contract, update_contract
 from funding_tracker.coordinators.live_collector import collect_live
-from funding_tracker.db import UOWFactoryType
+from funding_tracker.db import UnitOfWork, UOWFactoryType
 from funding_tracker.materialized_view_refresher import MaterializedViewRefresher
 
 if TYPE_CHECKING:
@@ -22,24 +25,34 @@ logger = logging.getLogger(__name__)
 class ExchangeOrchestrator:
     """Coordinates update() and update_live() operations for scheduler."""
 
+    # Failures per update() cycle logged with a full traceback
+    _FAILURE_TRACEBACK_BUDGET = 5
+
     def __init__(
         self,
         exchange_adapter: "BaseExchange",
         section_name: str,
         uow_factory: UOWFactoryType,
-        semaphore: asyncio.Semaphore,
+        concurrency_limit: int,
         mv_refresher: MaterializedViewRefresher,
     ) -> None:
         self._exchange_adapter = exchange_adapter
         self._section_name = section_name
         self._uow_factory = uow_factory
         self._mv_refresher = mv_refresher
-        self._semaphore = semaphore
+        self._concurrency_limit = concurrency_limit
+
+        # Coordinators pre-bound to this exchange, resolved once instead of per call
+        self._sync_contract = functools.partial(sync_contract, exchange_adapter)
+        self._update_contract = functools.partial(update_contract, exchange_adapter)
+        self._collect_live = functools.partial(
+            collect_live, exchange_adapter, section_name, uow_factory
+        )
 
     async def update(self) -> None:
         """Register contracts, then sync/update history for each."""
-        start_time = datetime.now()
-        logger.info(f"Starting update for {self._section_name}")
+        start_ns = time.monotonic_ns()
+        logger.info("Starting update for %s", self._section_name)
 
         try:
             await register_contracts(
@@ -50,100 +63,167 @@ class ExchangeOrchestrator:
             )
         except Exception as e:
             logger.error(
-                f"Failed to register contracts for {self._section_name}: {e}",
+                "Failed to register contracts for %s: %s",
+                self._section_name,
+                e,
                 exc_info=True,
             )
             return
 
         async with self._uow_factory() as uow:
             contracts = await uow.contracts.get_active_by_section(self._section_name)
+            newest_timestamps = await uow.contracts.get_newest_history_timestamps(
+                self._section_name
+            )
 
         if not contracts:
-            logger.warning(f"No contracts found for {self._section_name}")
-            duration = datetime.now() - start_time
+            logger.warning("No contracts found for %s", self._section_name)
             logger.info(
-                f"Update completed for {self._section_name} in {duration} "
-                f"(no contracts to process)"
+                "Update completed for %s in %d ms (no contracts to process)",
+                self._section_name,
+                (time.monotonic_ns() - start_ns) // 1_000_000,
             )
             return
 
-        logger.debug(f"Processing {len(contracts)} contracts for {self._section_name}")
+        now = datetime.now()
+        pending = [
+            contract
+            for contract in contracts
+            if self._has_pending_history(contract, newest_timestamps, now)
+        ]
+        logger.debug(
+            "Processing %s contracts for %s (%s within funding interval, skipped)",
+            len(pending),
+            self._section_name,
+            len(contracts) - len(pending),
+        )
 
         # Track statistics
         updated_count = 0
         total_points = 0
-
-        async def process_contract(contract: Contract) -> tuple[int, int]:
-            """Process contract with timeout protection."""
-            async with self._semaphore:
+        # Full tracebacks only for the first few failures per cycle; a broken upstream
+        # otherwise formats one traceback per contract
+        traceback_budget = self._FAILURE_TRACEBACK_BUDGET
+
+        async def process_contract(contract: Contract, uow: UnitOfWork) -> tuple[int, int] | None:
+            """Process contract with timeout protection; returns None if it failed."""
+            nonlocal traceback_budget
+            try:
+                if not contract.synced:
+                    async with asyncio.timeout(600.0):  # 10 minutes for sync
+                        points = await self._sync_contract(contract, uow)
+                else:
+                    async with asyncio.timeout(60.0):  # 1 minute for update
+                        points = await self._update_contract(contract, uow)
+                return (1 if points > 0 else 0, points)
+            except TimeoutError:
+                logger.warning(
+                    "[%s] %s/%s timed out after %s - operation: %s",
+                    self._section_name,
+                    contract.asset.name,
+                    contract.quote_name,
+                    "10m" if not contract.synced else "1m",
+                    "sync" if not contract.synced else "update",
+                )
+                await self._rollback_quietly(uow)
+                return None
+            except Exception as e:
+                with_traceback = traceback_budget > 0
+                traceback_budget -= 1
+                logger.error(
+                    "Failed to process contract %s/%s on %s: %s%s",
+                    contract.asset.name,
+                    contract.quote_name,
+                    self._section_name,
+                    e,
+                    "" if with_traceback else " (traceback suppressed)",
+                    exc_info=with_traceback,
+                )
+                await self._rollback_quietly(uow)
+                return None
+
+        remaining = iter(pending)
+
+        async def worker() -> None:
+            nonlocal updated_count, total_points
+            contract = next(remaining, None)
+            while contract is not None:
+                # One session per worker, reused for every contract it pulls; the coordinators
+                # commit after each step, so the connection is only held during DB calls. A
+                # session that saw a failure is discarded and the next contract gets a new one.
                 try:
-                    if not contract.synced:
-                        async with asyncio.timeout(600.0):  # 10 minutes for sync
-                            points = await sync_contract(
-                                self._exchange_adapter,
-                                contract,
-                                self._uow_factory,
-                            )
-                    else:
-                        async with asyncio.timeout(60.0):  # 1 minute for update
-                            points = await update_contract(
-                                self._exchange_adapter,
-                                contract,
-                                self._uow_factory,
-                            )
-                    return (1 if points > 0 else 0, points)
-                except TimeoutError:
-                    contract_id = f"{contract.asset.name}/{contract.quote_name}"
-                    timeout_duration = "10m" if not contract.synced else "1m"
-                    logger.warning(
-                        f"[{self._section_name}] {contract_id} timed out after {timeout_duration}"
-                        f" - operation: {'sync' if not contract.synced else 'update'}"
-                    )
-                    return (0, 0)
+                    async with self._uow_factory() as uow:
+                        while contract is not None:
+                            result = await process_contract(contract, uow)
+                            contract = next(remaining, None)
+                            if result is None:
+                                break
+                            was_updated, points = result
+                            updated_count += was_updated
+                            total_points += points
+                            # Merged contracts and loaded points are not needed once done
+                            uow.expunge_all()
                 except Exception as e:
-                    logger.error(
-                        f"Failed to process contract {contract.asset.name}/{contract.quote_name} "
-                        f"on {self._section_name}: {e}",
-                        exc_info=True,
-                    )
-                    return (0, 0)
-
-        logger.debug(f"[{self._section_name}] Starting gather for {len(contracts)} contracts")
-        tasks = [process_contract(contract) for contract in contracts]
-        results = await asyncio.gather(*tasks)
+                    logger.warning("[%s] Worker session cleanup failed: %s", self._section_name, e)
 
-        logger.debug(f"[{self._section_name}] Gather complete, aggregating results...")
-
-        # Aggregate statistics
-        for was_updated, points in results:
-            updated_count += was_updated
-            total_points += points
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(min(self._concurrency_limit, len(pending))):
+                task_group.create_task(worker())
 
         logger.debug(
-            f"[{self._section_name}] Aggregation complete: "
-            f"{updated_count}/{len(contracts)} updated"
+            "[%s] Aggregation complete: %s/%s updated",
+            self._section_name,
+            updated_count,
+            len(contracts),
         )
 
-        duration = datetime.now() - start_time
+        duration_ms = (time.monotonic_ns() - start_ns) // 1_000_000
         logger.info(
-            f"History update for {self._section_name}: "
-            f"{updated_count} contracts updated ({total_points} new points), "
-            f"{len(contracts) - updated_count} unchanged, "
-            f"completed in {duration}"
+            "History update for %s: %s contracts updated (%s new points), "
+            "%s unchanged, completed in %d ms",
+            self._section_name,
+            updated_count,
+            total_points,
+            len(contracts) - updated_count,
+            duration_ms,
         )
 
+    @staticmethod
+    def _has_pending_history(
+        contract: Contract, newest_timestamps: dict[UUID, datetime], now: datetime
+    ) -> bool:
+        """Mirror update_contract's interval check without a per-contract query.
+
+        Unsynced contracts and synced ones without history always go to the coordinators.
+        """
+        if not contract.synced:
+            return True
+        newest = newest_timestamps.get(contract.id)
+        if newest is None:
+            return True
+        # Same +1 second offset update_contract applies before comparing
+        after_timestamp = newest + timedelta(seconds=1)
+        return now - after_timestamp >= timedelta(hours=contract.funding_interval)
+
+    async def _rollback_quietly(self, uow: UnitOfWork) -> None:
+        """Roll back after a contract failure; the connection itself may be gone."""
+        try:
+            await uow.rollback()
+        except Exception as e:
+            logger.warning(
+                "[%s] Rollback after contract failure failed: %s", self._section_name, e
+            )
+
     async def update_live(self) -> None:
         """Collect live funding rates for all active contracts."""
-        logger.debug(f"Collecting live rates for {self._section_name}")
+        logger.debug("Collecting live rates for %s", self._section_name)
 
         try:
-            await collect_live(
-                self._exchange_adapter,
-                self._section_name,
-                self._uow_factory,
-            )
+            await self._collect_live()
         except Exception as e:
             logger.error(
-                f"Failed to collect live rates for {self._section_name}: {e}",
+                "Failed to collect live rates for %s: %s",
+                self._section_name,
+                e,
                 exc_info=True,
             )
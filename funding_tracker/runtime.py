@@ -11,6 +11,17 @@ from funding_tracker.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# Shared defaults: returned as-is when no overrides are configured, so never mutate them
+_DEFAULT_ENGINE_KWARGS: dict[str, Any] = {
+    "echo": False,
+    "pool_pre_ping": True,
+    "pool_size": 30,
+    "max_overflow": 200,
+}
+_DEFAULT_SESSION_KWARGS: dict[str, Any] = {
+    "expire_on_commit": False,
+}
+
 
 @dataclass(frozen=True)
 class RuntimeConfig:
@@ -27,9 +38,12 @@ class RuntimeConfig:
 
 
 def build_runtime_config(
-    args: argparse.Namespace, settings: Settings, all_exchanges: set[str]
+    args: argparse.Namespace, settings: Settings, all_exchanges: tuple[str, ...]
 ) -> RuntimeConfig:
-    """Resolve final runtime configuration used by main()."""
+    """Resolve final runtime configuration used by main().
+
+    all_exchanges must be sorted; the resolved exchange list keeps that order.
+    """
     exchanges_arg = args.exchanges if args.exchanges is not None else settings.exchanges
     debug_exchanges_arg = (
         args.debug_exchanges if args.debug_exchanges is not None else settings.debug_exchanges
@@ -51,15 +65,19 @@ def build_runtime_config(
     if instance_id >= total_instances:
         raise ValueError("INSTANCE_ID must be less than TOTAL_INSTANCES")
 
-    exchanges = _parse_exchanges_spec(exchanges_arg, all_exchanges)
-
-    if exchanges is None:
-        exchanges = sorted(all_exchanges)
-
-    if total_instances > 1:
-        exchanges = _filter_exchanges_by_instance(exchanges, instance_id, total_instances)
-    elif len(exchanges) == len(all_exchanges):
+    exchanges: list[str] | None
+    if not exchanges_arg and total_instances == 1:
+        # No filter and no sharding: run everything without materializing the list
         exchanges = None
+    else:
+        exchanges = _parse_exchanges_spec(exchanges_arg, all_exchanges)
+        if exchanges is None:
+            exchanges = list(all_exchanges)
+
+        if total_instances > 1:
+            exchanges = _filter_exchanges_by_instance(exchanges, instance_id, total_instances)
+        elif len(exchanges) == len(all_exchanges):
+            exchanges = None
 
     return RuntimeConfig(
         db_connection=settings.db_connection,
@@ -73,25 +91,32 @@ def build_runtime_config(
     )
 
 
-def _parse_exchanges_spec(exchanges_spec: str | None, all_exchanges: set[str]) -> list[str] | None:
+def _parse_exchanges_spec(
+    exchanges_spec: str | None, all_exchanges: tuple[str, ...]
+) -> list[str] | None:
     """Parse and validate comma-separated exchanges string."""
     if not exchanges_spec:
         return None
 
-    requested = {item.strip() for item in exchanges_spec.split(",") if item.strip()}
-    if not requested:
-        return None
+    valid: list[str] = []
+    unknown: list[str] = []
+    seen: set[str] = set()
+    for item in exchanges_spec.split(","):
+        name = item.strip()
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        (valid if name in all_exchanges else unknown).append(name)
 
-    unknown = requested - all_exchanges
     if unknown:
         logger.warning(
             "Unknown exchange IDs requested: %s. Available exchanges: %s",
-            sorted(unknown),
-            sorted(all_exchanges),
+            unknown,
+            list(all_exchanges),
         )
 
-    valid = sorted(requested & all_exchanges)
     if valid:
+        valid.sort()
         logger.info("Filtered to %s exchange(s): %s", len(valid), valid)
         return valid
 
@@ -99,28 +124,25 @@ def _parse_exchanges_spec(exchanges_spec: str | None, all_exchanges: set[str]) -
 
 
 def _resolve_engine_kwargs(service_engine_kwargs: dict[str, Any] | None) -> dict[str, Any]:
-    defaults = {
-        "echo": False,
-        "pool_pre_ping": True,
-        "pool_size": 30,
-        "max_overflow": 200,
-    }
-    return {**defaults, **(service_engine_kwargs or {})}
+    if not service_engine_kwargs:
+        return _DEFAULT_ENGINE_KWARGS
+    return {**_DEFAULT_ENGINE_KWARGS, **service_engine_kwargs}
 
 
 def _resolve_session_kwargs(service_session_kwargs: dict[str, Any] | None) -> dict[str, Any]:
-    defaults = {
-        "expire_on_commit": False,
-    }
-    return {**defaults, **(service_session_kwargs or {})}
+    if not service_session_kwargs:
+        return _DEFAULT_SESSION_KWARGS
+    return {**_DEFAULT_SESSION_KWARGS, **service_session_kwargs}
 
 
 def _filter_exchanges_by_instance(
     exchanges: list[str], instance_id: int, total_instances: int
 ) -> list[str]:
-    """Distribute exchanges across instances by simple round-robin."""
+    """Distribute exchanges across instances by simple round-robin.
+
+    Expects exchanges already sorted, so every instance derives the same assignment.
+    """
     if total_instances <= 1:
         return exchanges
 
-    sorted_exchanges = sorted(exchanges)
-    return sorted_exchanges[instance_id::total_instances]
+    return exchanges[instance_id::total_instances]
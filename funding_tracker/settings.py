@@ -1,6 +1,6 @@
 """Environment-backed settings for funding tracker."""
 
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any
 
 from pydantic import Field
@@ -29,6 +29,7 @@ class Settings(BaseSettings):
     exchanges: str | None = Field(default=None, alias="EXCHANGES")
     instance_id: int = Field(default=0, alias="INSTANCE_ID")
     total_instances: int = Field(default=1, alias="TOTAL_INSTANCES")
+    uvloop: bool = Field(default=False, alias="FT_UVLOOP")
 
     @cached_property
     def db(self) -> FTDBSettings:
@@ -37,3 +38,9 @@ class Settings(BaseSettings):
     @property
     def db_connection(self) -> str:
         return self.db.connection_url
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return process-wide settings, parsing the environment and .env only once."""
+    return Settings()  # type: ignore[call-arg]
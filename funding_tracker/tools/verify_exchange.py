@@ -12,6 +12,7 @@ from rich.table import Table
 
 from funding_tracker.exchanges import EXCHANGES
 from funding_tracker.exchanges.dto import ContractInfo
+from funding_tracker.infrastructure import http_client
 
 console = Console()
 
@@ -211,12 +212,15 @@ async def amain(argv: list[str] | None = None) -> int:
         console.print("[bold red][FAIL][/bold red] --preview-limit must be >= 1")
         return 1
 
-    success = await verify_exchange(
-        exchange_id=args.exchange_id,
-        history_days=args.history_days,
-        contract_index=args.contract_index,
-        preview_limit=args.preview_limit,
-    )
+    try:
+        success = await verify_exchange(
+            exchange_id=args.exchange_id,
+            history_days=args.history_days,
+            contract_index=args.contract_index,
+            preview_limit=args.preview_limit,
+        )
+    finally:
+        await http_client.close()
     return 0 if success else 1
 
 